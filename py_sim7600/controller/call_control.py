@@ -116,7 +116,7 @@ class CallController(DeviceController):
 
         command = 'AT+CBST='
 
-        if bearer_speed == BearerServiceSpeed.BIT_TRANSPARENT or bearer_speed == BearerServiceSpeed.MULTIMEDIA:
+        if bearer_speed in (BearerServiceSpeed.BIT_TRANSPARENT, BearerServiceSpeed.MULTIMEDIA):
             # For bit-transparent and multimedia, bearer_name and bearer_ce are fixed
             if bearer_name != BearerServiceName.SYNC_MODEM or bearer_ce != BearerServiceConnectionElement.TRANSPARENT:
                 raise CallControlException('Bearer name and connection element setting error')
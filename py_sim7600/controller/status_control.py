@@ -390,7 +390,7 @@ class StatusController(DeviceController):
         :raises StatusControlException: Delta value error
         """
 
-        if delta < 0 or delta > 5:
+        if not 0 <= delta <= 5:
             raise StatusControlException('Delta value error')
 
         try:
@@ -5,19 +5,236 @@ This file may raise V25TERException,
 remember to capture accordingly.
 """
 
+import asyncio
 import time
 import re
+from contextlib import contextmanager
+from functools import lru_cache
 
 from py_sim7600.controller import DeviceController
-from py_sim7600.exceptions import V25TERException, DeviceException
+from py_sim7600.controller.call_control import CallController
+from py_sim7600.exceptions import V25TERException, DeviceException, DeviceErrorResponseException
 from py_sim7600.model import enums
 
 
+_OK = 'OK'
+"""
+Final result code of a successful command
+"""
+
+_CONNECT = 'CONNECT'
+"""
+Result code of a successful data connection
+"""
+
+_ERROR = 'ERROR'
+"""
+Final result code of a failed command
+"""
+
+_FIXED_COMMANDS = {
+    're_issue': b'A/\r',
+    'answer': b'ATA\r',
+    'disconnect': b'ATH\r',
+    'voice_hangup_disconnect': b'AT+CVHU=0;H\r',
+    'get_auto_answer': b'ATS0?\r',
+    'switch_to_command': b'+++\r',
+    'switch_to_data': b'ATO\r',
+    'info': b'ATI\r',
+    'get_baud': b'AT+IPR?\r',
+    'get_control_character': b'AT+ICF?\r',
+    'get_data_flow': b'AT+IFC?\r',
+    'current_config': b'AT&V\r',
+    'save_config': b'AT&W0\r',
+    'restore_config': b'ATZ0\r',
+    'get_manufacturer': b'AT+CGMI\r',
+    'get_model': b'AT+CGMM\r',
+    'get_revision': b'AT+CGMR\r',
+    'get_serial': b'AT+CGSN\r',
+    'get_te_charset': b'AT+CSCS?\r',
+    'get_international_subscriber': b'AT+CIMI\r',
+    'get_another_subscriber': b'AT+CIMIM\r',
+    'get_capabilities': b'AT+GCAP\r',
+}
+"""
+Pre-encoded commands that take no argument, keyed by the method sending them
+"""
+
+_ICF_PARITY_FORMATS = frozenset({
+    enums.ControlCharacterFormat.D8P1S1,
+    enums.ControlCharacterFormat.D7P1S1,
+})
+"""
+Control character formats that carry a parity bit, and thus require a parity code
+"""
+
+_ICF_NO_PARITY = (None, enums.ControlCharacterParity.NONE)
+"""
+Parity codes accepted for the formats without a parity bit
+"""
+
+_IFC_FLOW_CONTROL = (0, 2)
+"""
+Flow control values for AT+IFC, indexed by whether hardware flow control is enabled
+"""
+
+_SETTER_COMMANDS = {
+    'set_dcd_function': (b'AT&C%d\r', 2, 'DCD function'),
+    'enable_command_echo': (b'ATE%d\r', 1, 'command echo'),
+    'set_dtr': (b'AT&D%d\r', 2, 'DTR function'),
+    'set_dsr': (b'AT&S%d\r', 1, 'DSR function'),
+    'set_result_format': (b'ATV%d\r', 1, 'result format'),
+    'set_result_presentation': (b'ATQ%d\r', 1, 'result presentation'),
+    'set_connect_format': (b'ATX%d\r', 4, 'connect format'),
+    'set_connect_protocol': (b'AT\\V%d\r', 1, 'connect protocol'),
+    'set_connect_speed': (b'AT&E%d\r', 1, 'connect speed'),
+}
+"""
+Setters taking a single numeric value, keyed by the method using them.
+Each entry holds the command template, the maximum value accepted, and the setting name.
+"""
+
+
+_IPR_PATTERN = re.compile(r'\+IPR: (\d+)')
+"""
+Baud rate reported by AT+IPR?
+"""
+
+_ICF_PATTERN = re.compile(r'\+ICF: (\d+),(\d+)')
+"""
+Control character framing reported by AT+ICF?
+"""
+
+_IFC_PATTERN = re.compile(r'\+IFC: (\d+),(\d+)')
+"""
+Data flow control reported by AT+IFC?
+"""
+
+_CSCS_PATTERN = re.compile(r'\+CSCS: "(\w+)"')
+"""
+TE character set reported by AT+CSCS?
+"""
+
+_IMSI_PATTERN = re.compile(r'(^\d{15})')
+"""
+International mobile subscriber identity reported by AT+CIMI and AT+CIMIM
+"""
+
+
+@lru_cache(maxsize=256)
+def _parse_config_item(item: str) -> tuple:
+    """
+    Parse a single configuration item into a key-value pair.
+
+    The result is cached, as the device reports the same items on every call.
+    Values with multiple fields are returned as tuples, so that the cached result cannot be modified.
+
+    :param item: A string representing the configuration item.
+    :return: A tuple of the key and the value.
+    """
+
+    k, v = [x.strip() for x in item.split(':')]
+    if ',' in v:
+        # Use a generator expression for concise and efficient parsing
+        v = tuple(int(x) if x.isdigit() else x for x in v.split(','))
+    else:
+        v = int(v) if v.isdigit() else v
+    return k, v
+
+
+class CommandPipeline:
+    """
+    Commands queued to be sent to the device in a single command line
+    """
+
+    def __init__(self):
+        self.commands: list[str] = []
+        self.results: list[str] = []
+
+    def append(self, command: str) -> int:
+        """
+        Queue a command to the pipeline
+
+        :param command: Raw command to queue, starting with "AT"
+        :return: The index of the result of this command in results
+        :rtype: int
+        """
+
+        self.commands.append(command)
+
+        return len(self.commands) - 1
+
+
 class V25TERController(DeviceController):
     """
     Controller for AT Commands According to V.25TER
     """
 
+    guard_time: float = 1                         # Seconds of silence before the +++ escape sequence
+    __call_controller: CallController = None      # Created on first fallback disconnect
+
+    def _set(self, setter: str, value: int) -> bool:
+        """
+        Send a numeric setting from the setter table
+
+        :param setter: The method name the setting is registered under
+        :param value: The value to set
+        :return: True if setting is successful
+        :rtype: bool
+        :raises V25TERException: Value out of range, or the device rejects the setting
+        """
+
+        command, maximum, name = _SETTER_COMMANDS[setter]
+
+        if not 0 <= value <= maximum:
+            raise V25TERException(f'Value error for {name}')
+
+        try:
+            self.device.send(
+                command=command % value,
+                back=_OK,
+                error_pattern=[_ERROR],
+            )
+        except DeviceException as e:
+            raise V25TERException(f'Cannot set {name}') from e
+
+        return True
+
+    @contextmanager
+    def pipeline(self):
+        """
+        Send the commands queued in the context in one command line
+
+        The device answers the whole line at once, so several queries cost a
+        single round trip. Only commands that respond with exactly one line
+        can be queued, and the results are available after the context exits.
+
+        Example::
+
+            with controller.pipeline() as pipeline:
+                pipeline.append('AT+CGMI')
+                pipeline.append('AT+CGMM')
+
+            manufacturer, model = pipeline.results
+
+        :return: The pipeline to queue commands to
+        :rtype: CommandPipeline
+        """
+
+        pipeline = CommandPipeline()
+
+        yield pipeline
+
+        if not pipeline.commands:
+            return
+
+        try:
+            pipeline.results = self.device.send_batch(
+                commands=pipeline.commands,
+            )
+        except DeviceException as e:
+            raise V25TERException('Cannot execute pipelined commands') from e
+
     def re_issue(self) -> str:
         """
         Re-issues the Last Command Given
@@ -30,7 +247,7 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='A/',
+                command=_FIXED_COMMANDS['re_issue'],
             )
         except DeviceException as e:
             raise V25TERException('Cannot re-issue last command') from e
@@ -52,7 +269,7 @@ class V25TERController(DeviceController):
         """
 
         command = 'ATD' + number
-        back = 'OK'
+        back = _OK
         if anonymous:
             command += 'I'
 
@@ -62,19 +279,35 @@ class V25TERController(DeviceController):
         if voice:
             command += ';'
         else:
-            back = 'CONNECT'
+            back = _CONNECT
 
         try:
             self.device.send(
                 command=command,
                 back=back,
-                error_pattern=['NO CARRIER', 'ERROR'],
+                error_pattern=['NO CARRIER', _ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot dial number') from e
 
         return True
 
+    async def dial_async(self, number: str, anonymous=False, cug_invocation=False, voice=True) -> bool:
+        """
+        Mobile Originated Call to Dial A Number, without blocking the event loop
+
+        Corresponding command: ATD
+
+        :param voice: Control whether to make a data call
+        :param cug_invocation: Control whether this call should invoke Closed User Group
+        :param anonymous: Control whether to display caller number
+        :param number: Number to call
+        :return: True if call is successful
+        :rtype: bool
+        """
+
+        return await asyncio.to_thread(self.dial, number, anonymous, cug_invocation, voice)
+
     def dial_from(self, target: str | int, memory: enums.PhonebookStorage = None, voice=True) -> bool:
         """
         Originate call from specified memory or active memory
@@ -86,11 +319,15 @@ class V25TERController(DeviceController):
         :param target: The target to call
         :return: True if call is successful
         :rtype: bool
-        :raises AssertionError: Memory type error
+        :raises TypeError: Target type error
+        :raises V25TERException: Memory type error
         """
 
+        if memory is not None and not isinstance(memory, enums.PhonebookStorage):
+            raise V25TERException('Memory type error')
+
         command = 'ATD>'
-        back = 'OK'
+        back = _OK
 
         if isinstance(target, str):
             target = f'"{target}"'
@@ -108,19 +345,36 @@ class V25TERController(DeviceController):
         if voice:
             command += ';'
         else:
-            back = 'CONNECT'
+            back = _CONNECT
 
         try:
             self.device.send(
                 command=command,
                 back=back,
-                error_pattern=['NO CARRIER', 'ERROR'],
+                error_pattern=['NO CARRIER', _ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot dial number') from e
 
         return True
 
+    async def dial_from_async(self, target: str | int, memory: enums.PhonebookStorage = None, voice=True) -> bool:
+        """
+        Originate call from specified memory or active memory, without blocking the event loop
+
+        Corresponding command: ATD>
+
+        :param voice: Control whether to make a data call
+        :param memory: The memory to pull number from. Leave empty to use currently active memory
+        :param target: The target to call
+        :return: True if call is successful
+        :rtype: bool
+        :raises TypeError: Target type error
+        :raises V25TERException: Memory type error
+        """
+
+        return await asyncio.to_thread(self.dial_from, target, memory, voice)
+
     def answer(self) -> bool:
         """
         Call answer
@@ -134,8 +388,8 @@ class V25TERController(DeviceController):
 
         try:
             self.device.send(
-                command='ATA',
-                back='OK',
+                command=_FIXED_COMMANDS['answer'],
+                back=_OK,
                 error_pattern=['NO CARRIER'],
             )
         except DeviceException as e:
@@ -143,36 +397,78 @@ class V25TERController(DeviceController):
 
         return True
 
+    async def answer_async(self) -> bool:
+        """
+        Call answer, without blocking the event loop
+
+        Corresponding command: ATA
+
+        :return: True if answering call is successful
+        :rtype: bool
+        :raises V25TERException: No incoming call
+        """
+
+        return await asyncio.to_thread(self.answer)
+
     def disconnect(self) -> bool:
         """
         Disconnect existing call
 
-        Corresponding command: ATH
+        Corresponding command: AT+CVHU=0;H, or AT+CVHU=0 and ATH if the former fails
 
         :return: True if call is disconnected
         :rtype: bool
+        :raises V25TERException: The device does not respond, or refuses to disconnect
         """
 
-        from .call_control import CallController
+        try:
+            # Let ATH disconnect voice calls, and hang up in the same command line
+            self.device.send(
+                command=_FIXED_COMMANDS['voice_hangup_disconnect'],
+                back=_OK,
+                error_pattern=[_ERROR],
+            )
 
-        call_controller = CallController(self.device)
+            return True
+        except DeviceErrorResponseException:
+            # The device refused the command line, try the commands separately
+            pass
+        except DeviceException as e:
+            # Anything else will not be solved by sending more commands
+            raise V25TERException('Cannot disconnect call') from e
+
+        # Fall back to separate commands, in case the device refuses AT+CVHU=0
+        if self.__call_controller is None:
+            self.__call_controller = CallController(device=self.device)
 
         try:
-            call_controller.set_control_voice_hangup(disconnect_ath=True)
+            self.__call_controller.set_control_voice_hangup(disconnect_ath=True)
         except Exception as e:
-            if not call_controller.get_control_voice_hangup():
+            if not self.__call_controller.get_control_voice_hangup():
                 raise e
 
         try:
             self.device.send(
-                command='ATH',
-                back='OK'
+                command=_FIXED_COMMANDS['disconnect'],
+                back=_OK
             )
         except DeviceException as e:
             raise V25TERException('Cannot disconnect call') from e
 
         return True
 
+    async def disconnect_async(self) -> bool:
+        """
+        Disconnect existing call, without blocking the event loop
+
+        Corresponding command: AT+CVHU=0;H, or AT+CVHU=0 and ATH if the former fails
+
+        :return: True if call is disconnected
+        :rtype: bool
+        """
+
+        return await asyncio.to_thread(self.disconnect)
+
     def set_auto_answer(self, times: int) -> bool:
         """
         Automatic answer incoming call
@@ -185,18 +481,14 @@ class V25TERController(DeviceController):
         :raises V25TERException: Auto answer time set to too long or too short
         """
 
-        command = 'ATS0='
-
-        if times > 255 or times < 0:
+        if not 0 <= times <= 255:
             raise V25TERException('Auto answer times out of range')
 
-        command += str(times).zfill(3)
-
         try:
             self.device.send(
-                command=command,
-                back='OK',
-                error_pattern=['ERROR'],
+                command=b'ATS0=%03d\r' % times,
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot set auto answer') from e
@@ -214,13 +506,11 @@ class V25TERController(DeviceController):
         :raises V25TERException: Auto answer time set to too long or too short
         """
 
-        command = 'ATS0?'
-
         try:
             result = self.device.send(
-                command=command,
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['get_auto_answer'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot get auto answer') from e
@@ -239,12 +529,34 @@ class V25TERController(DeviceController):
         :rtype: bool
         """
 
-        time.sleep(1)
+        time.sleep(self.guard_time)
 
         try:
             self.device.send(
-                command='+++',
-                back='OK',
+                command=_FIXED_COMMANDS['switch_to_command'],
+                back=_OK,
+            )
+        except DeviceException as e:
+            raise V25TERException('Cannot switch to command mode') from e
+
+        return True
+
+    async def switch_to_command_async(self) -> bool:
+        """
+        Switch from data mode to command mode, without blocking the event loop during the guard time
+
+        Corresponding command: +++
+
+        :return: True if switch is successful
+        :rtype: bool
+        """
+
+        await asyncio.sleep(self.guard_time)
+
+        try:
+            await self.device.send_async(
+                command=_FIXED_COMMANDS['switch_to_command'],
+                back=_OK,
             )
         except DeviceException as e:
             raise V25TERException('Cannot switch to command mode') from e
@@ -263,9 +575,9 @@ class V25TERController(DeviceController):
 
         try:
             self.device.send(
-                command='ATO',
-                back='CONNECT',
-                error_pattern=['NO CARRIER', 'ERROR'],
+                command=_FIXED_COMMANDS['switch_to_data'],
+                back=_CONNECT,
+                error_pattern=['NO CARRIER', _ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot switch to data mode') from e
@@ -284,8 +596,8 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='ATI',
-                back='OK',
+                command=_FIXED_COMMANDS['info'],
+                back=_OK,
             )
         except DeviceException as e:
             raise V25TERException('Cannot get product identification') from e
@@ -293,7 +605,7 @@ class V25TERController(DeviceController):
         result_dict = {}
 
         for line in result.split('\r'):
-            if line != 'OK':
+            if line != _OK:
                 key, value = line.split(': ')
 
                 if ',' in value:
@@ -325,13 +637,11 @@ class V25TERController(DeviceController):
         :rtype: bool
         """
 
-        command = 'AT+IPR=' + str(baud)
-
         try:
             self.device.send(
-                command=command,
-                back='OK',
-                error_pattern=['ERROR'],
+                command=b'AT+IPR=%d\r' % baud,
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot set baud rate') from e
@@ -350,14 +660,13 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+IPR?',
-                back='OK',
+                command=_FIXED_COMMANDS['get_baud'],
+                back=_OK,
             )
         except DeviceException as e:
             raise V25TERException('Cannot get baud rate') from e
 
-        pattern = r'\+IPR: (\d+)'
-        result = re.search(pattern, result)
+        result = _IPR_PATTERN.search(result)
 
         return int(result.group(1))
 
@@ -377,25 +686,21 @@ class V25TERController(DeviceController):
         :raises V25TERException: Parity code error or Format code error
         """
 
-        command = 'AT+ICF='
-
-        if format_control == enums.ControlCharacterFormat.D7P1S1 or \
-                format_control == enums.ControlCharacterFormat.D8P1S1:
+        if format_control in _ICF_PARITY_FORMATS:
             if parity is None:
                 raise V25TERException('Parity code need to be set for this format')
-            else:
-                command += f'{format_control.value},{parity.value}'
+
+            command = b'AT+ICF=%d,%d\r' % (format_control.value, parity.value)
+        elif parity in _ICF_NO_PARITY:
+            command = b'AT+ICF=%d\r' % format_control.value
         else:
-            if parity is not None and parity != enums.ControlCharacterParity.NONE:
-                raise V25TERException('Parity code no need to be set for this format')
-            else:
-                command += str(format_control.value)
+            raise V25TERException('Parity code no need to be set for this format')
 
         try:
             result = self.device.send(
                 command=command,
-                back='OK',
-                error_pattern=['ERROR'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot set control character framing') from e
@@ -414,14 +719,13 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+ICF?',
-                back='OK',
+                command=_FIXED_COMMANDS['get_control_character'],
+                back=_OK,
             )
         except DeviceException as e:
             raise V25TERException('Cannot get control character framing') from e
 
-        pattern = r'\+ICF: (\d+),(\d+)'
-        result = re.search(pattern, result)
+        result = _ICF_PATTERN.search(result)
 
         return (
             enums.ControlCharacterFormat(int(result.group(1))),
@@ -441,18 +745,11 @@ class V25TERController(DeviceController):
         :raises V25TERException: Control value error
         """
 
-        command = 'AT+IFC='
-
-        dce = 2 if rts else 0
-        dte = 2 if cts else 0
-
-        command += f'{dce},{dte}'
-
         try:
             self.device.send(
-                command=command,
-                back='OK',
-                error_pattern=['ERROR'],
+                command=b'AT+IFC=%d,%d\r' % (_IFC_FLOW_CONTROL[bool(rts)], _IFC_FLOW_CONTROL[bool(cts)]),
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot set data flow control') from e
@@ -471,15 +768,14 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+IFC?',
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['get_data_flow'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot get data flow control') from e
 
-        pattern = r'\+IFC: (\d+),(\d+)'
-        result = re.search(pattern, result)
+        result = _IFC_PATTERN.search(result)
 
         return (
             int(result.group(1)) == 2,
@@ -498,19 +794,7 @@ class V25TERController(DeviceController):
         :raises V25TERException: DCD value error
         """
 
-        if dcd < 0 or dcd > 2:
-            raise V25TERException('DCD value error')
-
-        try:
-            self.device.send(
-                command='AT&C' + str(dcd),
-                back='OK',
-                error_pattern=['ERROR'],
-            )
-        except DeviceException as e:
-            raise V25TERException('Cannot set DCD function') from e
-
-        return True
+        return self._set('set_dcd_function', dcd)
 
     def enable_command_echo(self, enable: bool) -> bool:
         """
@@ -524,16 +808,7 @@ class V25TERController(DeviceController):
         :raises V25TERException: Device echo value error
         """
 
-        try:
-            self.device.send(
-                command='ATE' + str(int(enable)),
-                back='OK',
-                error_pattern=['ERROR'],
-            )
-        except DeviceException as e:
-            raise V25TERException('Cannot set command echo') from e
-
-        return True
+        return self._set('enable_command_echo', enable)
 
     def current_config(self) -> dict:
         """
@@ -547,40 +822,23 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT&V',
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['current_config'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot get current configuration') from e
 
         config = {}
-        items = (item.strip() for item in result.split('\r') if item.strip() and item.strip() != 'OK')
-
-        def parse_config_item(item: str) -> dict:
-            """
-            Parse a single configuration item into a key-value pair.
-
-            :param item: A string representing the configuration item.
-            :return: A dictionary with a single key-value pair.
-            """
-
-            c = {}
-            k, v = [x.strip() for x in item.split(':')]
-            if ',' in v:
-                # Use a generator expression for concise and efficient parsing
-                v = [int(x) if x.isdigit() else x for x in v.split(',')]
-            else:
-                v = int(v) if v.isdigit() else v
-            c[k] = v
-            return c
+        items = (item.strip() for item in result.split('\r') if item.strip() and item.strip() != _OK)
 
         for item in items:
             config_set = item.split(';')
             for c in config_set:
                 c = c.strip()
                 if c:
-                    config.update(parse_config_item(c))
+                    key, value = _parse_config_item(c)
+                    config[key] = list(value) if isinstance(value, tuple) else value
 
         return config
 
@@ -596,19 +854,7 @@ class V25TERController(DeviceController):
         :raises V25TERException: DTR Mode value error
         """
 
-        if dtr < 0 or dtr > 2:
-            raise V25TERException('DTR Mode value error')
-
-        try:
-            self.device.send(
-                command='AT&D' + str(dtr),
-                back='OK',
-                error_pattern=['ERROR'],
-            )
-        except DeviceException as e:
-            raise V25TERException('Cannot set DTR function') from e
-
-        return True
+        return self._set('set_dtr', dtr)
 
     def set_dsr(self, always_on: bool) -> bool:
         """
@@ -621,16 +867,7 @@ class V25TERController(DeviceController):
         :rtype: bool
         """
 
-        try:
-            self.device.send(
-                command='AT&S' + str(int(always_on)),
-                back='OK',
-                error_pattern=['ERROR'],
-            )
-        except DeviceException as e:
-            raise V25TERException('Cannot set DSR function') from e
-
-        return True
+        return self._set('set_dsr', always_on)
 
     def set_result_format(self, verbose: bool) -> bool:
         """
@@ -643,15 +880,7 @@ class V25TERController(DeviceController):
         :rtype: bool
         """
 
-        try:
-            self.device.send(
-                command='ATV' + str(int(verbose)),
-                back='OK',
-            )
-        except DeviceException as e:
-            raise V25TERException('Cannot set result format') from e
-
-        return True
+        return self._set('set_result_format', verbose)
 
     def reset_config(self, temporary=False) -> bool:
         """
@@ -672,7 +901,7 @@ class V25TERController(DeviceController):
         try:
             self.device.send(
                 command=command,
-                back='OK',
+                back=_OK,
             )
         except DeviceException as e:
             raise V25TERException('Cannot reset configuration') from e
@@ -691,19 +920,12 @@ class V25TERController(DeviceController):
         :raises V25TERException: Result format display mode value error
         """
 
-        if transmit:
-            dce = 0
-        else:
-            dce = 1
-
         try:
-            self.device.send(
-                command='ATQ' + str(dce),
-                back='OK',
-            )
-        except DeviceException as e:
+            self._set('set_result_presentation', not transmit)
+        except V25TERException:
+            # With result codes suppressed, the device does not acknowledge the command
             if transmit:
-                raise V25TERException('Cannot set result presentation') from e
+                raise
 
         return True
 
@@ -719,19 +941,7 @@ class V25TERController(DeviceController):
         :raises V25TERException: Connect mode value error
         """
 
-        if mode < 0 or mode > 4:
-            raise V25TERException('Connect mode value error')
-
-        try:
-            self.device.send(
-                command='ATX' + str(mode),
-                back='OK',
-                error_pattern=['ERROR'],
-            )
-        except DeviceException as e:
-            raise V25TERException('Cannot set connect format') from e
-
-        return True
+        return self._set('set_connect_format', mode)
 
     def set_connect_protocol(self, report=False) -> bool:
         """
@@ -745,16 +955,7 @@ class V25TERController(DeviceController):
         :raises V25TERException: Report mode value error
         """
 
-        try:
-            self.device.send(
-                command='AT\\V' + str(int(report)),
-                back='OK',
-                error_pattern=['ERROR'],
-            )
-        except DeviceException as e:
-            raise V25TERException('Cannot set connect protocol') from e
-
-        return True
+        return self._set('set_connect_protocol', report)
 
     def set_connect_speed(self, report_serial=True) -> bool:
         """
@@ -767,15 +968,7 @@ class V25TERController(DeviceController):
         :rtype: bool
         """
 
-        try:
-            self.device.send(
-                command='AT&E' + str(int(report_serial)),
-                back='OK',
-            )
-        except DeviceException as e:
-            raise V25TERException('Cannot set connect speed') from e
-
-        return True
+        return self._set('set_connect_speed', report_serial)
 
     def save_config(self) -> bool:
         """
@@ -789,9 +982,9 @@ class V25TERController(DeviceController):
 
         try:
             self.device.send(
-                command='AT&W0',
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['save_config'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot save configuration') from e
@@ -810,9 +1003,9 @@ class V25TERController(DeviceController):
 
         try:
             self.device.send(
-                command='ATZ0',
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['restore_config'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot restore configuration') from e
@@ -831,9 +1024,9 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+CGMI',
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['get_manufacturer'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot get manufacturer identification') from e
@@ -852,9 +1045,9 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+CGMM',
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['get_model'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot get model identification') from e
@@ -873,9 +1066,9 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+CGMR',
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['get_revision'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot get revision identification') from e
@@ -896,9 +1089,9 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+CGSN',
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['get_serial'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot get serial number identification') from e
@@ -921,8 +1114,8 @@ class V25TERController(DeviceController):
         try:
             self.device.send(
                 command=command,
-                back='OK',
-                error_pattern=['ERROR'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot set TE character set') from e
@@ -941,14 +1134,13 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+CSCS?',
-                back='OK',
+                command=_FIXED_COMMANDS['get_te_charset'],
+                back=_OK,
             )
         except DeviceException as e:
             raise V25TERException('Cannot get TE character set') from e
 
-        pattern = r'\+CSCS: "(\w+)"'
-        result = re.search(pattern, result)
+        result = _CSCS_PATTERN.search(result)
 
         return enums.TECharacterSet(result.group(1))
 
@@ -964,15 +1156,14 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+CIMI',
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['get_international_subscriber'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot get international mobile subscriber identity') from e
 
-        pattern = r'(^\d{15})'
-        result = re.search(pattern, result)
+        result = _IMSI_PATTERN.search(result)
 
         return int(result.group(1))
 
@@ -988,15 +1179,14 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+CIMIM',
-                back='OK',
-                error_pattern=['ERROR'],
+                command=_FIXED_COMMANDS['get_another_subscriber'],
+                back=_OK,
+                error_pattern=[_ERROR],
             )
         except DeviceException as e:
             raise V25TERException('Cannot get another international mobile subscriber identity') from e
 
-        pattern = r'(^\d{15})'
-        result = re.search(pattern, result)
+        result = _IMSI_PATTERN.search(result)
 
         return int(result.group(1))
 
@@ -1012,8 +1202,8 @@ class V25TERController(DeviceController):
 
         try:
             result = self.device.send(
-                command='AT+GCAP',
-                back='OK',
+                command=_FIXED_COMMANDS['get_capabilities'],
+                back=_OK,
             )
         except DeviceException as e:
             raise V25TERException('Cannot get capabilities') from e
@@ -2,12 +2,15 @@
 This module contains the classes and functions to interact with a SIMCom device.
 """
 
+import asyncio
+import select
 import serial
 import time
 import re
+from functools import lru_cache
 from threading import Semaphore
 
-from py_sim7600.exceptions import DeviceException
+from py_sim7600.exceptions import DeviceException, DeviceErrorResponseException
 
 # Attempt to import RPI.GPIO
 try:
@@ -17,6 +20,47 @@ except ImportError:
     is_rpi = False
 
 
+_CRLF = '\r\n'
+"""
+Line delimiter encapsulating every response of the device
+"""
+
+_OK = 'OK'
+"""
+Final result code of a successful command
+"""
+
+_VERIFY_COMMAND = b'AT\r'
+"""
+Pre-encoded command every SIMCom device answers with OK
+"""
+
+_FINAL_RESULT_CODE = re.compile(
+    rb'\r\n(?:OK|ERROR|CONNECT[^\r\n]*|NO CARRIER|BUSY|NO ANSWER|NO DIALTONE|\+CM[ES] ERROR: [^\r\n]*)\r\n'
+)
+"""
+Final result codes that end a response, so that no more data needs to be waited for
+"""
+
+
+@lru_cache
+def _response_splitter(pattern: str) -> re.Pattern:
+    """
+    Compile the regular expression segmenting responses encapsulated by the pattern
+
+    :param pattern: The pattern that encapsulates the response
+    :return: The compiled regular expression
+    :rtype: re.Pattern
+    """
+
+    escaped_pattern = re.escape(pattern)
+
+    return re.compile(
+        f'{escaped_pattern}(.+?){escaped_pattern}(?={escaped_pattern}|$)',
+        re.DOTALL
+    )
+
+
 class Device:
     """
     Class to communicate directly with SIMCom device
@@ -61,14 +105,12 @@ class Device:
         if not was_open:
             self.open()
 
-        with self.__sems[self.__port]:
-            self.__serial.write(b'AT\r')
-            response = self.read_full_response('\r\n')
+        response = self.transact(_VERIFY_COMMAND, _CRLF)
 
         if not was_open:
             self.close()
 
-        return 'OK' in response
+        return _OK in response
 
     @property
     def is_open(self) -> bool:
@@ -146,6 +188,22 @@ class Device:
         else:
             raise DeviceException('No GPIO access. Not on a Raspberry Pi?')
 
+    def __wait_for_data(self, timeout: float) -> None:
+        """
+        Block until the serial port has data to read, or the timeout elapses.
+
+        The file descriptor of the port is waited on when it has one, so the wait ends as soon as
+        data arrives. Otherwise, this falls back to polling in short sleeps.
+
+        :param timeout: Maximum time to wait in seconds
+        :return: None
+        """
+
+        try:
+            select.select([self.__serial.fileno()], [], [], timeout)
+        except (AttributeError, OSError, ValueError, serial.SerialException):
+            time.sleep(min(timeout, 0.01))
+
     def read_full_response(self, pattern: str, timeout=5) -> list[str] | None:
         """
         Read the full response from the device.
@@ -158,50 +216,68 @@ class Device:
         """
 
         start_time = time.time()
-        accumulated_data = ''
+        # Raw bytes are accumulated and only decoded once the response is complete
+        accumulated_data = bytearray()
+        encoded_pattern = pattern.encode()
         response_started = False
 
         time.sleep(0.1)
 
         # while True:
-        while time.time() - start_time < timeout:
+        while (remaining := timeout - (time.time() - start_time)) > 0:
             if self.__serial.in_waiting > 0:
-                accumulated_data += self.__serial.read(self.__serial.in_waiting).decode()
-                if pattern in accumulated_data:
+                accumulated_data += self.__serial.read(self.__serial.in_waiting)
+                if not response_started and encoded_pattern in accumulated_data:
                     response_started = True
-                if response_started and accumulated_data.endswith(pattern) and accumulated_data != pattern:
-                    # The response may contain the pattern in the middle, wait a bit more
-                    current_length = len(accumulated_data)
-                    time.sleep(0.1)
-                    accumulated_data += self.__serial.read(self.__serial.in_waiting).decode()
-
-                    if len(accumulated_data) == current_length:
-                        # Do a look-ahead match to segment one or multiple responses
-                        escaped_pattern = re.escape(pattern)
-
-                        re_pattern = re.compile(
-                            f'{escaped_pattern}(.+?){escaped_pattern}(?={escaped_pattern}|$)',
-                            re.DOTALL
-                        )
-
-                        matches = re_pattern.findall(accumulated_data)
-
-                        if matches:
-                            return matches
-                        else:
-                            return None
+                if response_started and accumulated_data.endswith(encoded_pattern) \
+                        and accumulated_data != encoded_pattern:
+                    # A final result code on the last line ends the response. Otherwise, the
+                    # response may contain the pattern in the middle, wait a bit more
+                    last_line = accumulated_data.rfind(encoded_pattern, 0, -len(encoded_pattern))
+
+                    if pattern != _CRLF or not _FINAL_RESULT_CODE.fullmatch(accumulated_data, max(last_line, 0)):
+                        current_length = len(accumulated_data)
+                        time.sleep(0.1)
+                        accumulated_data += self.__serial.read(self.__serial.in_waiting)
+
+                        if len(accumulated_data) != current_length:
+                            continue
+
+                    # Do a look-ahead match to segment one or multiple responses
+                    matches = _response_splitter(pattern).findall(accumulated_data.decode())
+
+                    if matches:
+                        return matches
                     else:
-                        continue
+                        return None
 
-            time.sleep(0.01)
+            self.__wait_for_data(remaining)
 
         raise DeviceException("Device read timeout")
 
-    def send(self, command: str, pattern: str, back: str = None, error_pattern: list[str] = None, timeout=5) -> str:
+    def transact(self, command: bytes, pattern: str, timeout=5) -> list[str] | None:
+        """
+        Write a command to the device and read the full response, holding the port lock in between.
+
+        :param command: Encoded command to write, including the trailing carriage return
+        :param pattern: The pattern that encapsulates the response
+        :param timeout: Optional. Timeout time in seconds
+        :return: The response string. None if no response is received
+        :rtype: list[str] | None
+        :raises DeviceException: If the device read times out
+        """
+
+        with self.__sems[self.__port]:
+            self.__serial.write(command)
+
+            return self.read_full_response(pattern, timeout)
+
+    def send(self, command: str | bytes, pattern: str, back: str = None, error_pattern: list[str] = None, timeout=5) -> str:
         """
         Send a command to the device, and check for a successful response.
 
-        :param command: Raw command to send to the string
+        :param command: Raw command to send to the string. Bytes are written as they are, and must
+            already include the trailing carriage return
         :param back: String expected to be in the successful result
         :param error_pattern: Optional. The response that should be considered an error
         :param timeout: Optional. Timeout time in seconds
@@ -209,24 +285,26 @@ class Device:
         :return: The result string returned by the device
         :rtype: str
         :raises DeviceException: If the device is off or the command fails
+        :raises DeviceErrorResponseException: If the device replies with an error
         """
 
         if not self.__is_on:
             raise DeviceException("Device not on")
 
-        with self.__sems[self.__port]:
-            try:
-                self.__serial.write((command + "\r").encode())
-                response = self.read_full_response(pattern, timeout)
-            except Exception as e:
-                raise DeviceException() from e
+        if isinstance(command, str):
+            command = (command + '\r').encode()
+
+        try:
+            response = self.transact(command, pattern, timeout)
+        except Exception as e:
+            raise DeviceException() from e
 
         result_message = None
         error_message = ''
 
         if response is not None:
             for message in response:
-                if error_pattern is not None and any([error in message for error in error_pattern]):
+                if error_pattern is not None and any(error in message for error in error_pattern):
                     error_message = message
                     continue
 
@@ -246,13 +324,65 @@ class Device:
                 self.__urc.append(message)
 
             if error_message:
-                raise DeviceException(f"Device returned error: {error_message}")
+                raise DeviceErrorResponseException(f"Device returned error: {error_message}")
 
             if result_message is not None:
                 return result_message
 
         raise DeviceException("Device returned no valid response")
 
+    async def send_async(self, command: str | bytes, **kwargs) -> str:
+        """
+        Send a command to the device without blocking the event loop.
+
+        The exchange runs in a worker thread, and is guarded by the same lock as send().
+
+        :param command: Raw command to send to the string
+        :param kwargs: Optional. Other parameters accepted by send()
+        :return: The result string returned by the device
+        :rtype: str
+        :raises DeviceException: If the device is off or the command fails
+        """
+
+        return await asyncio.to_thread(self.send, command, **kwargs)
+
+    def send_batch(self, commands: list[str], pattern: str, timeout=5) -> list[str]:
+        """
+        Send several commands concatenated into one command line, and collect their responses.
+
+        The commands are joined with ';' behind a single "AT" prefix, so the device answers all of
+        them with one final result code. Every command must respond with exactly one line.
+
+        :param commands: Raw commands to send, each starting with "AT"
+        :param pattern: The pattern that encapsulates the response
+        :param timeout: Optional. Timeout time in seconds
+        :return: The result strings, in the same order as the commands
+        :rtype: list[str]
+        :raises DeviceException: If the device is off, the command fails, or the responses do not match the commands
+        :raises DeviceErrorResponseException: If the device replies with an error
+        """
+
+        if not self.__is_on:
+            raise DeviceException("Device not on")
+
+        command = 'AT' + ';'.join(c.removeprefix('AT') for c in commands) + '\r'
+
+        try:
+            response = self.transact(command.encode(), pattern, timeout)
+        except Exception as e:
+            raise DeviceException() from e
+
+        if not response:
+            raise DeviceException("Device returned no valid response")
+
+        if response[-1] != _OK:
+            raise DeviceErrorResponseException(f"Device returned error: {response}")
+
+        if len(response) - 1 != len(commands):
+            raise DeviceException("Device responses do not match the commands sent")
+
+        return response[:-1]
+
     @property
     def urc(self, clear=True) -> list[str]:
         """
@@ -265,7 +395,7 @@ class Device:
         # Read the device again to get more spontaneous responses
         with self.__sems[self.__port]:
             try:
-                matches = self.read_full_response('\r\n')
+                matches = self.read_full_response(_CRLF)
                 if matches is not None:
                     self.__urc.extend(matches)
             except DeviceException:
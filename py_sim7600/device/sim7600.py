@@ -15,7 +15,10 @@ class SIM7600Device(Device):
     def read_full_response(self, pattern='\r\n', timeout=2) -> str | None:
         return super().read_full_response(pattern, timeout)
 
-    def send(self, command: str, pattern='\r\n', back: str = None, error_pattern: list[str] = None, timeout=2) -> str | None:
+    def transact(self, command: bytes, pattern='\r\n', timeout=2) -> list[str] | None:
+        return super().transact(command, pattern, timeout)
+
+    def send(self, command: str | bytes, pattern='\r\n', back: str = None, error_pattern: list[str] = None, timeout=2) -> str | None:
         return super().send(
             command=command,
             pattern=pattern,
@@ -24,6 +27,13 @@ class SIM7600Device(Device):
             error_pattern=error_pattern,
         )
 
+    def send_batch(self, commands: list[str], pattern='\r\n', timeout=2) -> list[str]:
+        return super().send_batch(
+            commands=commands,
+            pattern=pattern,
+            timeout=timeout,
+        )
+
     def verify(self) -> bool:
         if not super().verify():
             return False
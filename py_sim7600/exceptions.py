@@ -86,6 +86,13 @@ class DeviceException(SIM7600Exception):
     pass
 
 
+class DeviceErrorResponseException(DeviceException):
+    """
+    Exception raised by Device class when the device replies with an error result code
+    """
+    pass
+
+
 class InterfaceException(SIM7600Exception):
     """
     Exception raised by Interface class
@@ -1,63 +1,111 @@
-import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from .enums import CallState, CallNumberType, BearerServiceMode
 
 
+_CALL_STATES = {state.value: state for state in CallState}
+"""
+Call states, keyed by their code in the list call response
+"""
+
+_SERVICE_MODES = {mode.value: mode for mode in BearerServiceMode}
+"""
+Bearer/tele service modes, keyed by their code in the list call response
+"""
+
+_NUMBER_TYPES = {number_type.value: number_type for number_type in CallNumberType}
+"""
+Number types, keyed by their code in the list call response
+"""
+
+
+def _unquote(value: str) -> str:
+    """
+    Remove the pair of double quotes around a string field, if present.
+
+    :param value: The field as it appears in the response.
+    :return: The field without the quotes.
+    :rtype: str
+    """
+
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1]
+
+    return value
+
+
+@lru_cache(maxsize=256)
+def _parse_clcc(response: str) -> tuple:
+    """
+    Parse one line of the list call response. The modem repeats the same lines while polling, so
+    the parsed fields are cached.
+
+    :param response: One line of the list call response.
+    :return: The fields of the call, in the order of the Call constructor.
+    :rtype: tuple
+    :raises ValueError: If the response is invalid.
+    """
+
+    prefix, separator, fields = response.partition('+CLCC: ')
+
+    if prefix or not separator:
+        raise ValueError('Invalid response')
+
+    # The phonebook entry is free text, so it is never split
+    parts = fields.split(',', 7)
+
+    if len(parts) < 5:
+        raise ValueError('Invalid response')
+
+    try:
+        call_id = int(parts[0])
+        oriented = bool(int(parts[1]))
+        state = _CALL_STATES[int(parts[2])]
+        service_mode = _SERVICE_MODES[int(parts[3])]
+        multiparty = bool(int(parts[4]))
+
+        if len(parts) > 6:
+            number = _unquote(parts[5])
+            number_type = _NUMBER_TYPES[int(parts[6])]
+        else:
+            number = None
+            number_type = None
+    except KeyError as e:
+        raise ValueError('Invalid response') from e
+
+    if len(parts) > 7:
+        phonebook_entry = _unquote(parts[7])
+    else:
+        phonebook_entry = None
+
+    return call_id, oriented, state, service_mode, multiparty, number, number_type, phonebook_entry
+
+
+@dataclass(slots=True, frozen=True)
 class Call:
     """
-    This class represents a call object.
+    This class represents a call object. Calls are immutable, and compare equal regardless of their
+    state, so the same call can be matched across list call responses.
+
+    :param call_id: The ID of the call, usually a continuous integer.
+    :param oriented: The orientation of the call, True for outgoing, False for incoming.
+    :param state: The state of the call.
+    :param service_mode: The mode of bearer/tele service of this call.
+    :param multiparty: Whether the call is multiparty call.
+    :param number: The number of the call, as the number_type specifies.
+    :param number_type: The type of the number.
+    :param phonebook_entry: The phonebook entry of the number.
     """
-    def __init__(self,
-                 call_id: int,
-                 oriented: bool,
-                 state: CallState,
-                 service_mode: BearerServiceMode,
-                 multiparty: bool,
-                 number: str = None,
-                 number_type: CallNumberType = None,
-                 phonebook_entry: str = None,
-                 ):
-        """
-        This class represents a call object.
-
-        :param call_id: The ID of the call, usually a continuous integer.
-        :param oriented: The orientation of the call, True for outgoing, False for incoming.
-        :param state: The state of the call.
-        :param service_mode: The mode of bearer/tele service of this call.
-        :param multiparty: Whether the call is multiparty call.
-        :param number: The number of the call, as the number_type specifies.
-        :param number_type: The type of the number.
-        :param phonebook_entry: The phonebook entry of the number.
-        """
-        self.call_id = call_id
-        self.oriented = oriented
-        self.state = state
-        self.service_mode = service_mode
-        self.multiparty = multiparty
-        self.number = number
-        self.number_type = number_type
-        self.phonebook_entry = phonebook_entry
-
-    def __eq__(self, other):
-        if not isinstance(other, Call):
-            return NotImplemented
-
-        if self.call_id != other.call_id:
-            return False
-        if self.oriented != other.oriented:
-            return False
-        if self.service_mode != other.service_mode:
-            return False
-        if self.multiparty != other.multiparty:
-            return False
-        if self.number != other.number:
-            return False
-        if self.number_type != other.number_type:
-            return False
-        if self.phonebook_entry != other.phonebook_entry:
-            return False
-
-        return True
+
+    call_id: int
+    oriented: bool
+    state: CallState = field(compare=False)
+    service_mode: BearerServiceMode
+    multiparty: bool
+    number: str = None
+    number_type: CallNumberType = None
+    phonebook_entry: str = None
 
     @classmethod
     def from_list_call(cls, response: str):
@@ -66,43 +114,7 @@ class Call:
 
         :param response: One line of the list call response.
         :return: A Call object.
+        :raises ValueError: If the response is invalid.
         """
 
-        pattern = re.compile(r'\+CLCC: (\d+),(\d+),(\d+),(\d+),(\d+)((,"[^"]+",\d+)(,".*")?)?')
-
-        match = pattern.match(response)
-
-        if match:
-            groups = match.groups()
-
-            call_id = int(groups[0])
-            oriented = bool(int(groups[1]))
-            state = CallState(int(groups[2]))
-            service_mode = BearerServiceMode(int(groups[3]))
-            multiparty = bool(int(groups[4]))
-
-            if groups[5]:
-                combined_str = groups[6].strip(',')
-                number = combined_str.split(',')[0].strip('"')
-                number_type = CallNumberType(int(combined_str.split(',')[1]))
-            else:
-                number = None
-                number_type = None
-
-            if groups[7]:
-                phonebook_entry = groups[7].strip(',"')
-            else:
-                phonebook_entry = None
-
-            return cls(
-                call_id=call_id,
-                oriented=oriented,
-                state=state,
-                service_mode=service_mode,
-                multiparty=multiparty,
-                number=number,
-                number_type=number_type,
-                phonebook_entry=phonebook_entry,
-            )
-        else:
-            raise ValueError('Invalid response')
+        return cls(*_parse_clcc(response))
@@ -1,30 +1,56 @@
 import re
+from dataclasses import dataclass
 from functools import total_ordering
 
 
+_CSQ_PATTERN = re.compile(r'\+CSQ: (\d+),(\d+)')
+"""
+Signal quality report, with the RSSI/RSCP value and the bit error rate
+"""
+
+_BER_MAX = (0.0001, 0.001, 0.005, 0.01, 0.02, 0.04, 0.08, 1)
+"""
+The maximum bit error rate of each category, indexed by the category
+"""
+
+
 @total_ordering
+@dataclass(slots=True, frozen=True)
 class SignalQuality:
     """
     This class represents the signal quality of the device.
+
+    :param strength: The strength of the signal, in dBm.
+    :param is_rscp: Whether the strength is RSCP (using TD-SCDMA) or RSSI (using GSM).
+    :param bit_error_rate: The bit error rate of the signal, in category.
     """
-    def __init__(self,
-                 strength: int,
-                 is_rscp: bool,
-                 bit_error_rate: int,
-                 ):
+
+    strength: int
+    is_rscp: bool
+    bit_error_rate: int
+
+    def _key(self) -> tuple:
         """
-        This class represents the signal quality of the device.
+        The key to order signal qualities of the same type by. An undefined strength or BER is
+        always worse than a defined one. Otherwise, the strength takes precedence, then the lower
+        BER category, so that only equal readings share a key.
 
-        :param strength: The strength of the signal, in dBm.
-        :param is_rscp: Whether the strength is RSCP (using TD-SCDMA) or RSSI (using GSM).
-        :param bit_error_rate: The bit error rate of the signal, in category.
+        :return: The comparison key
+        :rtype: tuple
         """
 
-        self.strength = strength
-        self.is_rscp = is_rscp
-        self.bit_error_rate = bit_error_rate
+        is_defined = self.strength != -999 and self.bit_error_rate != 99
+
+        return is_defined, self.strength, -self.bit_error_rate
 
     def __eq__(self, other: 'SignalQuality') -> bool:
+        # A reading is most often compared against the last one kept
+        if self is other:
+            return True
+
+        if not isinstance(other, SignalQuality):
+            return NotImplemented
+
         return (self.strength == other.strength
                 and self.is_rscp == other.is_rscp
                 and self.bit_error_rate == other.bit_error_rate)
@@ -34,18 +60,7 @@ class SignalQuality:
         if self.is_rscp != other.is_rscp:
             raise TypeError('Cannot compare RSCP and RSSI signal quality')
 
-        # The one with undefined strength or BER is always worse
-        if self.strength == -999 or self.bit_error_rate == 99:
-            return True
-        if other.strength == -999 or other.bit_error_rate == 99:
-            return False
-
-        # If strength is the same, compare BER
-        if self.strength == other.strength:
-            return self.bit_error_rate > other.bit_error_rate
-
-        # Strength takes precedence
-        return self.strength < other.strength
+        return self._key() < other._key()
 
     @classmethod
     def from_quality_query(cls, response: str) -> 'SignalQuality':
@@ -58,8 +73,7 @@ class SignalQuality:
         :raises ValueError: If the response is invalid.
         """
 
-        pattern = r'\+CSQ: (\d+),(\d+)'
-        match = re.search(pattern, response)
+        match = _CSQ_PATTERN.search(response)
 
         if not match:
             raise ValueError('Invalid response')
@@ -89,7 +103,7 @@ class SignalQuality:
 
         bit_error_rate = int(match.group(2))
 
-        if bit_error_rate < 0 or (bit_error_rate > 7 and bit_error_rate != 99):
+        if not 0 <= bit_error_rate <= 7 and bit_error_rate != 99:
             raise ValueError('Invalid bit error rate value')
 
         return cls(strength, is_rscp, bit_error_rate)
@@ -100,21 +114,8 @@ class SignalQuality:
         The maximum bit error rate.
         """
 
-        if self.bit_error_rate == 0:
-            return 0.0001
-        elif self.bit_error_rate == 1:
-            return 0.001
-        elif self.bit_error_rate == 2:
-            return 0.005
-        elif self.bit_error_rate == 3:
-            return 0.01
-        elif self.bit_error_rate == 4:
-            return 0.02
-        elif self.bit_error_rate == 5:
-            return 0.04
-        elif self.bit_error_rate == 6:
-            return 0.08
-        elif self.bit_error_rate == 7:
-            return 1
-        else:
-            return 1
+        if 0 <= self.bit_error_rate < len(_BER_MAX):
+            return _BER_MAX[self.bit_error_rate]
+
+        # Undefined (99) or unknown categories
+        return 1
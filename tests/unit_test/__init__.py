@@ -1,5 +1,6 @@
+from collections import defaultdict, deque
 from unittest.mock import MagicMock, patch
-from serial import SerialException, PortNotOpenError
+from serial import SerialException, SerialTimeoutException, PortNotOpenError
 
 
 class MockSerial:
@@ -13,29 +14,61 @@ class MockSerial:
         self._port = args[0]
         self._baudrate = args[1]
 
-        self._input_buffer = b''
-        self._output_buffer = b''
+        self._input_buffer = bytearray()
+        self._output_buffer = bytearray()
         self._is_open = False
 
-        self._responses = []
+        self._responses: defaultdict[bytes, deque[bytes]] = defaultdict(deque)
         self._should_raise = kwargs.get('should_raise', False)
+        self._force_timeout = kwargs.get('force_timeout', False)
         self._default_response = kwargs.get('default_response', b'')
 
     def add_response(self, response: dict[str, bytes]):
         """
         This method adds a response with a matching input to the mock.
+        Responses with the same input are replied in the order they are
+        added, and the last one is kept for any further write.
         """
 
-        self._responses.append(response)
+        self._responses[response['input']].append(response['output'])
+
+    def add_responses(self, responses: list[tuple[bytes, bytes]]):
+        """
+        This method adds several responses at once, each given as
+        a pair of the matching input and the output.
+        """
+
+        for input_data, output in responses:
+            self._responses[input_data].append(output)
+
+    def clear_responses(self):
+        """
+        This method removes all the responses added to the mock.
+        """
+
+        self._responses.clear()
+
+    def reset(self):
+        """
+        This method clears the responses and both buffers, so that
+        the mock can be reused by another test.
+        """
+
+        self.clear_responses()
+        self.reset_input_buffer()
+        self.reset_output_buffer()
 
     def reset_input_buffer(self):
-        self._input_buffer = b''
+        self._input_buffer.clear()
 
     def reset_output_buffer(self):
-        self._output_buffer = b''
+        self._output_buffer.clear()
 
     @property
     def in_waiting(self):
+        if self._force_timeout:
+            raise SerialTimeoutException('Read timeout')
+
         return len(self._input_buffer)
 
     @property
@@ -55,9 +88,11 @@ class MockSerial:
         or raises an exception.
         """
 
-        for response in self._responses:
-            if response['input'] == input_data:
-                return response['output']
+        # Writes may come as bytearray or memoryview, which cannot be used as keys
+        queue = self._responses.get(bytes(input_data))
+
+        if queue:
+            return queue.popleft() if len(queue) > 1 else queue[0]
 
         if self._should_raise:
             raise ValueError('No matching response found')
@@ -72,10 +107,8 @@ class MockSerial:
         if not self._is_open:
             raise PortNotOpenError()
 
-        self._output_buffer += data
-
-        response = self._respond(data)
-        self._input_buffer += response
+        self._output_buffer.extend(data)
+        self._input_buffer.extend(self._respond(data))
 
     def read(self, size=1):
         """
@@ -85,8 +118,13 @@ class MockSerial:
         if not self._is_open:
             raise PortNotOpenError()
 
-        data = self._input_buffer[:size]
-        self._input_buffer = self._input_buffer[size:]
+        if self._force_timeout:
+            raise SerialTimeoutException('Read timeout')
+
+        # Copy once through a view, which must be released before the buffer is resized
+        with memoryview(self._input_buffer) as view:
+            data = bytes(view[:size])
+        del self._input_buffer[:size]
 
         return data
 
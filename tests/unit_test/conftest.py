@@ -1,4 +1,6 @@
 import pytest
+import yaml
+from pathlib import Path
 from unittest.mock import patch
 
 from py_sim7600.device import Device
@@ -7,14 +9,28 @@ from py_sim7600.device.sim7600 import SIM7600Device
 from . import MockSerial
 
 
-@pytest.fixture
-def mock_serial():
-    with patch('serial.Serial', new=MockSerial) as mock_serial:
-        yield mock_serial
+RESPONSES_FILE = Path(__file__).parent.parent / 'fixtures' / 'sim7600_responses.yml'
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        'timeout_expected: the mock serial port times out on every read, instead of waiting for a reply',
+    )
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _patch_serial():
+    """
+    Replace the serial port class for the whole session, so no test ever opens a real port.
+    """
+
+    with patch('serial.Serial', new=MockSerial):
+        yield
 
 
 @pytest.fixture
-def mock_device(mock_serial) -> Device:
+def mock_device() -> Device:
     port = '/dev/ttyUSB0'
     baud = 115200
     device = Device(port, baud)
@@ -29,25 +45,52 @@ def mock_device(mock_serial) -> Device:
     yield device
 
 
-@pytest.fixture
-def mock_sim7600_device(mock_serial) -> SIM7600Device:
+@pytest.fixture(scope='session')
+def mock_responses() -> dict[bytes, bytes]:
+    """
+    The recorded responses every SIM7600 device needs to be verified, loaded once per session.
+    """
+
+    with open(RESPONSES_FILE, encoding='utf-8') as f:
+        transcript = yaml.safe_load(f)
+
+    return {exchange['input'].encode(): exchange['output'].encode() for exchange in transcript}
+
+
+@pytest.fixture(scope='session')
+def mock_sim7600_device(mock_responses) -> SIM7600Device:
+    """
+    A SIM7600 device shared by the whole session. Its mock serial port is reset before every test,
+    and stays open once a controller has opened it.
+    """
+
     port = '/dev/ttyUSB0'
     baud = 115200
-    device = SIM7600Device(port, baud)
+    serial_device = MockSerial(port, baud)
+    serial_device.add_responses(mock_responses.items())
 
-    device._Device__serial.add_response(
-        {
-            'input': b'AT\r',
-            'output': b'\r\nOK\r\n',
-        }
-    )
+    yield SIM7600Device(port, baud, serial_device=serial_device)
 
-    device._Device__serial.add_response(
-        {
-            'input': b'ATI\r',
-            'output': b'\r\nManufacturer: SIMCOM INCORPORATED\rModel: SIMCOM_SIM7600C\rRevision: SIM7600C '
-                      b'_V1.0\rIMEI: 351602000330570\r+GCAP: +CGSM,+FCLASS,+DS\rOK\r\n',
-        }
-    )
 
-    yield device
+def reset_sim7600_device(device: SIM7600Device, responses: dict[bytes, bytes]):
+    """
+    Bring a shared SIM7600 device back to the state it was built in.
+    """
+
+    serial_device = device._Device__serial
+    serial_device._force_timeout = False
+    serial_device.reset()
+    serial_device.add_responses(responses.items())
+
+    # Unsolicited responses left over by the previous test
+    device._Device__urc.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_sim7600_device(mock_sim7600_device, mock_responses):
+    reset_sim7600_device(mock_sim7600_device, mock_responses)
+
+    yield
+
+    # Also reset afterwards, as module-scoped controllers are built before the next reset
+    reset_sim7600_device(mock_sim7600_device, mock_responses)
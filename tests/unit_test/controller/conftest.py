@@ -1 +1,91 @@
+import pytest
 
+from py_sim7600.controller.call_control import CallController
+from py_sim7600.controller.status_control import StatusController
+from py_sim7600.controller.v25ter import V25TERController
+
+
+@pytest.fixture(scope='module')
+def status_controller(mock_sim7600_device) -> StatusController:
+    """
+    A status controller shared by the tests of a module, so that it is only built and verified once.
+    """
+
+    controller = StatusController(
+        device=mock_sim7600_device,
+    )
+
+    if not controller.device.is_open:
+        controller.open()
+
+    yield controller
+
+
+@pytest.fixture
+def mock_status_controller(status_controller, request) -> StatusController:
+    # Either a single (input, output) pair, or a list of them
+    responses = request.param if isinstance(request.param, list) else [request.param]
+
+    serial_device = status_controller.device._Device__serial
+    serial_device.add_responses(responses)
+    serial_device._force_timeout = request.node.get_closest_marker('timeout_expected') is not None
+
+    yield status_controller
+
+
+@pytest.fixture(scope='module')
+def v25ter_controller(mock_sim7600_device) -> V25TERController:
+    """
+    A V.25TER controller shared by the tests of a module, so that it is only built and verified once.
+    """
+
+    controller = V25TERController(
+        device=mock_sim7600_device,
+    )
+
+    # The mock port needs no silence around the escape sequence
+    controller.guard_time = 0
+
+    if not controller.device.is_open:
+        controller.open()
+
+    yield controller
+
+
+@pytest.fixture
+def mock_v25ter_controller(v25ter_controller, request) -> V25TERController:
+    # Either a single (input, output) pair, or a list of them
+    responses = request.param if isinstance(request.param, list) else [request.param]
+
+    serial_device = v25ter_controller.device._Device__serial
+    serial_device.add_responses(responses)
+    serial_device._force_timeout = request.node.get_closest_marker('timeout_expected') is not None
+
+    yield v25ter_controller
+
+
+@pytest.fixture(scope='module')
+def call_controller(mock_sim7600_device) -> CallController:
+    """
+    A call controller shared by the tests of a module, so that it is only built and verified once.
+    """
+
+    controller = CallController(
+        device=mock_sim7600_device,
+    )
+
+    if not controller.device.is_open:
+        controller.open()
+
+    yield controller
+
+
+@pytest.fixture
+def mock_call_controller(call_controller, request) -> CallController:
+    # Either a single (input, output) pair, or a list of them
+    responses = request.param if isinstance(request.param, list) else [request.param]
+
+    serial_device = call_controller.device._Device__serial
+    serial_device.add_responses(responses)
+
+    yield call_controller
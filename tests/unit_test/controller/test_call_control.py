@@ -1,58 +1,70 @@
 import pytest
-from numpy.testing import assert_equal
 
 import tests
 
 from py_sim7600.model import enums
-from py_sim7600.controller.call_control import CallController, CallControlException
 
 
-@pytest.fixture
-def mock_call_controller(mock_sim7600_device, request) -> CallController:
-    controller = CallController(
-        device=mock_sim7600_device,
-    )
-
-    if hasattr(request, 'param'):
-        payload = {
-            'input': request.param[0],
-            'output': request.param[1],
-        }
-
-        controller.device._Device__serial.add_response(payload)
-
-    controller.open()
-
-    yield controller
+_IO = {
+    'set_control_voice_hangup': (b'AT+CVHU=0\r', b'\r\nOK\r\n'),
+    'get_control_voice_hangup': (b'AT+CVHU?\r', b'\r\n+CVHU: 0\r\nOK\r\n'),
+    'hang_up': (b'AT+CHUP\r', b'\r\nVOICE CALL:END: 000017\r\nOK\r\n'),
+    'hang_up_no_call': (b'AT+CHUP\r', b'\r\nOK\r\n'),
+    'set_bearer_type': (b'AT+CBST=0,0,1\r', b'\r\nOK\r\n'),
+    'get_bearer_type': (b'AT+CBST?\r', b'\r\n+CBST: 0,0,1\r\nOK\r\n'),
+    'set_rlp_parameter': (b'AT+CRLP=61,61,48,6,0\r', b'\r\nOK\r\n'),
+    'get_rlp_parameter': (
+        b'AT+CRLP?\r',
+        b'\r\n+CRLP: 61,61,48,6,0\r\n+CRLP: 0,61,48,6,1\r\n+CRLP: 240,240,52,6,2\r\nOK\r\n',
+    ),
+    'set_service_report': (b'AT+CR=1\r', b'\r\nOK\r\n'),
+    'get_service_report': (b'AT+CR?\r', b'\r\n+CR: 1\r\nOK\r\n'),
+    'set_result_code': (b'AT+CRC=1\r', b'\r\nOK\r\n'),
+    'get_result_code': (b'AT+CRC?\r', b'\r\n+CRC: 1\r\nOK\r\n'),
+    'set_list_call': (b'AT+CLCC=1\r', b'\r\nOK\r\n'),
+    'get_list_call': (b'AT+CLCC?\r', b'\r\n+CLCC: 1\r\nOK\r\n'),
+}
+"""
+Canned device input and output for each test, keyed by the test name without its prefix
+"""
 
 
 class TestCallController:
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CVHU=0\r', b'\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize(
+        'mock_call_controller',
+        [_IO['set_control_voice_hangup']],
+        indirect=True,
+        ids=['set_control_voice_hangup'],
+    )
     def test_set_control_voice_hangup(self, mock_call_controller):
         result = mock_call_controller.set_control_voice_hangup(disconnect_ath=True)
 
         assert result
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CVHU?\r', b'\r\n+CVHU: 0\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize(
+        'mock_call_controller',
+        [_IO['get_control_voice_hangup']],
+        indirect=True,
+        ids=['get_control_voice_hangup'],
+    )
     def test_get_control_voice_hangup(self, mock_call_controller):
         result = mock_call_controller.get_control_voice_hangup()
 
         assert result
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CHUP\r', b'\r\nVOICE CALL:END: 000017\r\nOK\r\n')],
-                             indirect=True)
+    @pytest.mark.parametrize('mock_call_controller', [_IO['hang_up']], indirect=True, ids=['hang_up'])
     def test_hang_up(self, mock_call_controller):
         result = mock_call_controller.hang_up()
 
         assert result == 17
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CHUP\r', b'\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize('mock_call_controller', [_IO['hang_up_no_call']], indirect=True, ids=['hang_up_no_call'])
     def test_hang_up_no_call(self, mock_call_controller):
         result = mock_call_controller.hang_up()
 
         assert result == 0
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CBST=0,0,1\r', b'\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize('mock_call_controller', [_IO['set_bearer_type']], indirect=True, ids=['set_bearer_type'])
     def test_set_bearer_type(self, mock_call_controller):
         result = mock_call_controller.set_bearer_type(
             bearer_speed=enums.BearerServiceSpeed.AUTO,
@@ -62,20 +74,22 @@ class TestCallController:
 
         assert result
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CBST?\r', b'\r\n+CBST: 0,0,1\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize('mock_call_controller', [_IO['get_bearer_type']], indirect=True, ids=['get_bearer_type'])
     def test_get_bearer_type(self, mock_call_controller):
         result = mock_call_controller.get_bearer_type()
 
-        assert_equal(
-            result,
-            (
-                enums.BearerServiceSpeed.AUTO,
-                enums.BearerServiceName.ASYNC_MODEM,
-                enums.BearerServiceConnectionElement.NON_TRANSPARENT,
-            )
+        assert result == (
+            enums.BearerServiceSpeed.AUTO,
+            enums.BearerServiceName.ASYNC_MODEM,
+            enums.BearerServiceConnectionElement.NON_TRANSPARENT,
         )
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CRLP=61,61,48,6,0\r', b'\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize(
+        'mock_call_controller',
+        [_IO['set_rlp_parameter']],
+        indirect=True,
+        ids=['set_rlp_parameter'],
+    )
     def test_set_rlp_parameter(self, mock_call_controller):
         result = mock_call_controller.set_rlp_parameter(
             rlp_version=0,
@@ -89,21 +103,25 @@ class TestCallController:
 
     @pytest.mark.parametrize(
         'mock_call_controller',
-        [(b'AT+CRLP?\r', b'\r\n+CRLP: 61,61,48,6,0\r\n+CRLP: 0,61,48,6,1\r\n+CRLP: 240,240,52,6,2\r\nOK\r\n')],
-        indirect=True)
+        [_IO['get_rlp_parameter']],
+        indirect=True,
+        ids=['get_rlp_parameter'],
+    )
     def test_get_rlp_parameter(self, mock_call_controller):
         result = mock_call_controller.get_rlp_parameter()
 
-        assert_equal(
-            result,
-            [
-                (61, 61, 48, 6, 0),
-                (0, 61, 48, 6, 1),
-                (240, 240, 52, 6, 2),
-            ]
-        )
+        assert result == [
+            (61, 61, 48, 6, 0),
+            (0, 61, 48, 6, 1),
+            (240, 240, 52, 6, 2),
+        ]
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CR=1\r', b'\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize(
+        'mock_call_controller',
+        [_IO['set_service_report']],
+        indirect=True,
+        ids=['set_service_report'],
+    )
     def test_set_service_report(self, mock_call_controller):
         result = mock_call_controller.set_service_report(
             report=True,
@@ -111,13 +129,18 @@ class TestCallController:
 
         assert result
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CR?\r', b'\r\n+CR: 1\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize(
+        'mock_call_controller',
+        [_IO['get_service_report']],
+        indirect=True,
+        ids=['get_service_report'],
+    )
     def test_get_service_report(self, mock_call_controller):
         result = mock_call_controller.get_service_report()
 
         assert result
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CRC=1\r', b'\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize('mock_call_controller', [_IO['set_result_code']], indirect=True, ids=['set_result_code'])
     def test_set_result_code(self, mock_call_controller):
         result = mock_call_controller.set_result_code(
             extended_format=True,
@@ -125,13 +148,13 @@ class TestCallController:
 
         assert result
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CRC?\r', b'\r\n+CRC: 1\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize('mock_call_controller', [_IO['get_result_code']], indirect=True, ids=['get_result_code'])
     def test_get_result_code(self, mock_call_controller):
         result = mock_call_controller.get_result_code()
 
         assert result
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CLCC=1\r', b'\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize('mock_call_controller', [_IO['set_list_call']], indirect=True, ids=['set_list_call'])
     def test_set_list_call(self, mock_call_controller):
         result = mock_call_controller.set_list_call(
             auto_report=True,
@@ -139,7 +162,7 @@ class TestCallController:
 
         assert result
 
-    @pytest.mark.parametrize('mock_call_controller', [(b'AT+CLCC?\r', b'\r\n+CLCC: 1\r\nOK\r\n')], indirect=True)
+    @pytest.mark.parametrize('mock_call_controller', [_IO['get_list_call']], indirect=True, ids=['get_list_call'])
     def test_get_list_call(self, mock_call_controller):
         result = mock_call_controller.get_list_call()
 
@@ -1,3 +1,5 @@
+import pytest
+
 from py_sim7600.model.enums import CallState, CallNumberType, BearerServiceMode
 from py_sim7600.model.call import Call
 
@@ -73,3 +75,28 @@ class TestCall:
         assert call_2.number is None
         assert call_2.number_type is None
         assert call_2.phonebook_entry is None
+
+    def test_from_list_call_with_exception(self):
+        response_1 = '+CLCC: 1,1'
+        response_2 = '+CLCC: 1,1,4,0,0,"02152063113",999'
+        response_3 = 'RING'
+
+        with pytest.raises(ValueError):
+            Call.from_list_call(response_1)
+
+        with pytest.raises(ValueError):
+            Call.from_list_call(response_2)
+
+        with pytest.raises(ValueError):
+            Call.from_list_call(response_3)
+
+    def test_equality_ignores_state(self):
+        call_1 = Call.from_list_call('+CLCC: 1,1,2,0,0,"10011",129')
+        call_2 = Call.from_list_call('+CLCC: 1,1,0,0,0,"10011",129')
+
+        assert call_1 == call_2
+        assert hash(call_1) == hash(call_2)
+        assert call_1 != Call.from_list_call('+CLCC: 2,1,0,0,0,"10011",129')
+
+        with pytest.raises(AttributeError):
+            call_1.state = CallState.ACTIVE
@@ -96,6 +96,16 @@ class TestSignalQuality:
         # Unknown strength should always be worse
         assert signal_quality_1 > signal_quality_5
 
+        # Undefined signals are still ordered consistently between themselves
+        assert signal_quality_5 < signal_quality_3
+        assert signal_quality_3 > signal_quality_5
+        assert not signal_quality_5 > signal_quality_3
+        assert signal_quality_3 >= signal_quality_5
+        assert not signal_quality_5 >= signal_quality_3
+        assert signal_quality_5 <= signal_quality_3
+        assert max(signal_quality_3, signal_quality_5) is signal_quality_3
+        assert max(signal_quality_5, signal_quality_3) is signal_quality_3
+
         signal_quality_6 = SignalQuality(
             strength=-51,
             is_rscp=True,
@@ -115,67 +125,22 @@ class TestSignalQuality:
         # Compare BER if strength is the same
         assert signal_quality_6 < signal_quality_7
 
-    def test_ber_max(self):
-        signal_quality = SignalQuality(
-            strength=-51,
-            is_rscp=False,
-            bit_error_rate=0,
-        )
-
-        assert signal_quality.ber_max == 0.0001
-
-        signal_quality = SignalQuality(
-            strength=-51,
-            is_rscp=False,
-            bit_error_rate=1,
-        )
-
-        assert signal_quality.ber_max == 0.001
-
-        signal_quality = SignalQuality(
-            strength=-51,
-            is_rscp=False,
-            bit_error_rate=2,
-        )
-
-        assert signal_quality.ber_max == 0.005
-
-        signal_quality = SignalQuality(
-            strength=-51,
-            is_rscp=False,
-            bit_error_rate=3,
-        )
-
-        assert signal_quality.ber_max == 0.01
-
-        signal_quality = SignalQuality(
-            strength=-51,
-            is_rscp=False,
-            bit_error_rate=4,
-        )
-
-        assert signal_quality.ber_max == 0.02
-
+    @pytest.mark.parametrize('bit_error_rate, expected', [
+        (0, 0.0001),
+        (1, 0.001),
+        (2, 0.005),
+        (3, 0.01),
+        (4, 0.02),
+        (5, 0.04),
+        (6, 0.08),
+        (7, 1),
+        (99, 1),
+    ])
+    def test_ber_max(self, bit_error_rate, expected):
         signal_quality = SignalQuality(
             strength=-51,
             is_rscp=False,
-            bit_error_rate=5,
-        )
-
-        assert signal_quality.ber_max == 0.04
-
-        signal_quality = SignalQuality(
-            strength=-51,
-            is_rscp=False,
-            bit_error_rate=6,
-        )
-
-        assert signal_quality.ber_max == 0.08
-
-        signal_quality = SignalQuality(
-            strength=-51,
-            is_rscp=False,
-            bit_error_rate=7,
+            bit_error_rate=bit_error_rate,
         )
 
-        assert signal_quality.ber_max == 1
+        assert signal_quality.ber_max == expected
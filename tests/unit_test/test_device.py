@@ -1,12 +1,13 @@
 import pytest
 
 from py_sim7600.device import Device, DeviceException
+from py_sim7600.exceptions import DeviceErrorResponseException
 
 from . import MockSerial
 
 
 class TestDevice:
-    def test_init(self, mock_serial):
+    def test_init(self):
         port = '/dev/ttyUSB0'
         baud = 115200
         device = Device(port, baud)
@@ -46,3 +47,13 @@ class TestDevice:
         result = mock_device.send('AT', '\r\n')
 
         assert result == 'OK'
+
+    def test_send_with_error_response(self, mock_device):
+        mock_device.open()
+        mock_device._Device__serial.add_response({
+            'input': b'AT+CVHU=0;H\r',
+            'output': b'\r\nERROR\r\n',
+        })
+
+        with pytest.raises(DeviceErrorResponseException):
+            mock_device.send('AT+CVHU=0;H', '\r\n', back='OK', error_pattern=['ERROR'])